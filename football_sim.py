@@ -11,16 +11,22 @@ This is intentionally compact and explanatory. Use as a scaffold.
 """
 import random
 import math
-import statistics
 from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, NamedTuple
 import uuid
 import json
 import datetime
 import os
 import time
 import itertools
-import re
+import heapq
+import bisect
+import concurrent.futures
+from array import array
+try:
+    import orjson  # optional: much faster JSON encoder for the output dump
+except ImportError:
+    orjson = None
 
 # Base seed: default None -> time-based for variability. Set SIM_SEED to pin runs.
 SEED = None
@@ -44,20 +50,51 @@ def seeded_rand(seed_offset=0):
         base_seed = int(time.time_ns() % 1_000_000_000)
     return random.Random(base_seed + seed_offset)
 
+def write_json(path:str, payload:Any):
+    """Write payload as 2-space indented JSON, through orjson when it is installed."""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w") as f:
+            json.dump(payload, f, indent=2)
+
+def _mean(values, default=50):
+    # plain sum/len: statistics.mean's exact-fraction path is far slower on small float lists
+    return sum(values)/len(values) if values else default
+
+def spawn_seeds(rng:random.Random, n:int)->List[int]:
+    """
+    n child seeds (64-bit) for independent units of work such as games, drawn in order
+    from a seeded parent. They depend only on the parent's state, never on how many
+    workers run them or in which order they finish.
+    """
+    getrandbits = rng.getrandbits
+    return [getrandbits(64) for _ in range(n)]
+
 def team_rating(team:"Team")->float:
     """Simple overall derived from key attributes across roster."""
     if not team.roster:
         return 50.0
     vals=[]
     for p in team.roster:
-        vals.append(p.attributes.get("awareness",50))
-        vals.append(p.attributes.get("speed",50))
-        vals.append(p.attributes.get("strength",50))
-    return statistics.mean(vals)
+        vals.append(p.attributes["awareness"])
+        vals.append(p.attributes["speed"])
+        vals.append(p.attributes["strength"])
+    return sum(vals)/len(vals)
 
 # ---------------------------
 # Data Models
 # ---------------------------
+# Integer position codes; hot paths compare these instead of position strings.
+POS_QB, POS_RB, POS_WR, POS_TE, POS_OL, POS_DL, POS_LB, POS_DB, POS_K, POS_FB = range(10)
+POS_CODES = {"QB":POS_QB,"RB":POS_RB,"WR":POS_WR,"TE":POS_TE,"OL":POS_OL,
+             "DL":POS_DL,"LB":POS_LB,"DB":POS_DB,"K":POS_K,"FB":POS_FB}
+
+# Core attributes every Player carries (missing ones default to 50), so hot paths can
+# subscript player.attributes directly instead of .get(k, 50).
+ATTR_KEYS = ("speed","strength","awareness","throw_power","catching","route_running","break_tackle")
+
 @dataclass
 class Player:
     id: str
@@ -71,13 +108,24 @@ class Player:
     # Runtime state
     morale: float = 0.5
     fatigue: float = 0.0
-    injuries: List[str] = field(default_factory=list)
+    injuries: List[Dict[str,Any]] = field(default_factory=list)  # {"injury","when"} records; only kept with record_injury_detail
+    injury_count: int = 0
+    pos_code: int = field(default=-1, init=False, repr=False)
 
     def __post_init__(self):
-        # Derived quick lookup defaults
-        for k in ["speed","strength","awareness","throw_power","catching","route_running","break_tackle"]:
+        self.pos_code = POS_CODES.get(self.position, -1)
+        # Derived quick lookup defaults: every ATTR_KEYS entry is guaranteed present afterwards
+        for k in ATTR_KEYS:
             self.attributes.setdefault(k, 50.0)
 
+@dataclass(slots=True)
+class TeamStats:
+    # Season record in fixed slots; updated every game, so no string-keyed dict.
+    wins: int = 0
+    losses: int = 0
+    points_for: int = 0
+    points_against: int = 0
+
 @dataclass
 class Team:
     id: str
@@ -87,18 +135,47 @@ class Team:
     scheme_bias: Dict[str,float] = field(default_factory=lambda: {"pass":0.5,"run":0.5})
     coach_quality: float = 0.5
     resources: float = 1.0  # affects training, med staff, etc.
-    season_stats: Dict[str,Any] = field(default_factory=lambda: {"wins":0,"losses":0,"points_for":0,"points_against":0})
+    stats: TeamStats = field(default_factory=TeamStats)
     finances: Dict[str,float] = field(default_factory=lambda: {"cap":100.0})
+    # `agg`: the QB, position-group means and overall rating the play resolver reads every
+    # snap, read as team.agg[key]. Empty until refresh_aggregates(), which play_game calls at
+    # kickoff (and resolve_play when missing); call it again after roster changes.
+    agg: Dict[str,Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    @property
+    def season_stats(self)->Dict[str,int]:
+        """Read-only dict snapshot of self.stats for printing/JSON; write through self.stats."""
+        return asdict(self.stats)
+
+    def refresh_aggregates(self):
+        idx: Dict[int,List[Player]] = {}
+        for p in self.roster:
+            idx.setdefault(p.pos_code, []).append(p)
+        def group_mean(attr, codes):
+            return _mean([p.attributes[attr] for code in codes for p in idx.get(code, [])], default=50)
+        self.agg = {
+            "qb": idx[POS_QB][0] if idx.get(POS_QB) else None,
+            "def_coverage_mean": group_mean("awareness", (POS_DB,POS_LB)),
+            "def_rush_mean": group_mean("strength", (POS_DL,)),
+            "def_front_mean": group_mean("strength", (POS_DL,POS_LB)),
+            "off_line_mean": group_mean("strength", (POS_OL,)),
+            "overall_rating": team_rating(self),
+        }
 
-@dataclass
+class SchemeBias(NamedTuple):
+    # immutable pass/run lean for shared catalog entries (Team.scheme_bias is the mutable dict form)
+    pass_: float
+    run: float
+
+@dataclass(frozen=True, slots=True)
 class FbsSchool:
     id: str
     name: str
     prestige: float  # 0-1, used for offer weighting
-    scheme_bias: Dict[str,float]
+    scheme_bias: SchemeBias
     location: str
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NflFranchise:
     id: str
     name: str
@@ -125,6 +202,9 @@ class CareerState:
 # ---------------------------
 # Career Mode Engine (HS -> College -> NFL)
 # ---------------------------
+# str.translate table deleting every ASCII character except letters and spaces (the catalog names are ASCII)
+_SLUG_DROP = str.maketrans("", "", "".join(chr(i) for i in range(128) if not (chr(i).isalpha() or chr(i) == " ")))
+
 def build_fbs_catalog()->List[FbsSchool]:
     # Full FBS list (133 teams) with rough prestige tiers derived from ordering
     fbs_names = [
@@ -161,8 +241,8 @@ def build_fbs_catalog()->List[FbsSchool]:
     catalog = []
     for idx, name in enumerate(unique_names):
         prestige = max(0.35, 0.95 - (idx/(total*1.1)))
-        scheme = {"pass":0.45 + ((idx%5)*0.05), "run":0.55 - ((idx%5)*0.05)}
-        slug = re.sub(r'[^A-Za-z ]','', name).strip()
+        scheme = SchemeBias(pass_=0.45 + ((idx%5)*0.05), run=0.55 - ((idx%5)*0.05))
+        slug = name.translate(_SLUG_DROP).strip()
         words = slug.split()
         if not words:
             abbr = f"FBS{idx:03d}"
@@ -173,10 +253,52 @@ def build_fbs_catalog()->List[FbsSchool]:
         catalog.append(FbsSchool(id=abbr, name=name, location=name, prestige=prestige, scheme_bias=scheme))
     return catalog
 
+# static catalog shared by every CareerEngine and every state.college_team; safe because
+# FbsSchool is frozen and all of its fields (scheme_bias included) are immutable values
+_FBS_CATALOG = tuple(build_fbs_catalog())
+
+# attributes averaged into a career player's overall rating
+OVERALL_KEYS = ("speed","strength","awareness","throw_power","route_running","break_tackle")
+# attributes that grow each HS/college year, in draw order
+GROWTH_KEYS = ("speed","awareness","throw_power","route_running","break_tackle","strength")
+
+# (base, spread) offer counts per star tier, with the star-rating upper bound of each tier.
+# Bigger separation: 1-star (1-5), 2-star (3-10), 3-star (8-20), 4-star (15-35), 5-star (40-70)
+_OFFER_TIER_CUTS = (1.5, 2.5, 3.5, 4.5)
+_OFFER_TIERS = ((1,4), (3,7), (8,12), (15,20), (80,50))
+
+# awards_breakdown counter for each award name CareerEngine hands out (HS awards are not broken down)
+AWARD_BREAKDOWN_KEYS = {"Super Bowl":"super_bowl", "MVP":"mvp", "Pro Bowl":"pro_bowl", "All-Pro":"all_pro",
+                        "Heisman":"heisman", "All-American":"all_american", "Maxwell":"maxwell"}
+# upper-cased award level -> awards_by_level bucket; anything else is NFL
+AWARD_LEVEL_KEYS = {"HS":"HS", "COLLEGE":"College"}
+
 class CareerEngine:
-    def __init__(self, rng: random.Random):
+    def __init__(self, rng: random.Random, verbose:bool=True):
         self.rng = rng
-        self.fbs_catalog = build_fbs_catalog()
+        self.fbs_catalog = _FBS_CATALOG
+        self._catalog_source = None
+        self._catalog_terms()
+        # verbose=False skips formatting the human-readable state.history beats (batch runs)
+        self.verbose = verbose
+
+    def _catalog_terms(self):
+        """
+        Snapshot of self.fbs_catalog with what offers and commits derive from it: the schools
+        as a tuple, an id -> school index (first entry wins on abbreviation collisions, as in
+        a linear scan) and the prestige-only offer-weight terms. Rebuilt whenever fbs_catalog
+        has been replaced, so weights, drawn population and lookups always agree.
+        """
+        if self._catalog_source is not self.fbs_catalog:
+            catalog = tuple(self.fbs_catalog)
+            by_id: Dict[str,FbsSchool] = {}
+            for s in catalog:
+                by_id.setdefault(s.id, s)
+            self._catalog_source = self.fbs_catalog
+            self._catalog_snapshot = (catalog, by_id,
+                                      tuple(s.prestige for s in catalog),
+                                      tuple(1.25 - s.prestige*0.55 for s in catalog))
+        return self._catalog_snapshot
 
     def _base_attr_for_stars(self, stars:float)->float:
         # Map 0-5 stars to an overall-ish target (zengm-style normalization)
@@ -208,7 +330,7 @@ class CareerEngine:
             stage="HS",
             calendar={"phase":"HS", "year":1, "week":1},
             star_rating=float(stars),
-            history=[f"Created {stars}-star {pos} prospect {p.name} (pot {potential:.2f})"]
+            history=[f"Created {stars}-star {pos} prospect {p.name} (pot {potential:.2f})"] if self.verbose else []
         )
 
     def simulate_high_school_year(self, state:CareerState, year:int)->Dict[str,Any]:
@@ -216,7 +338,7 @@ class CareerEngine:
         volatility = max(0.15, (6 - state.star_rating)/6)  # more volatility for low stars
         overall_before = round(self._overall(p),1)
         touches = 80 + int(self.rng.random()*40)
-        per_touch = (p.attributes.get("speed",50)+p.attributes.get("awareness",50))/18
+        per_touch = (p.attributes["speed"]+p.attributes["awareness"])/18
         swing = self.rng.uniform(0.55 - volatility*0.25, 1.2 + volatility*0.45)
         production = max(250, int(per_touch*touches*swing))
         tds = int(max(2, production/120 * self.rng.uniform(0.8,1.2)))
@@ -227,18 +349,19 @@ class CareerEngine:
             awards.append("HS National POY")
         hs_line = {"year": year, "production_yards": production, "tds": tds, "awards": awards, "overall_before": overall_before}
         state.hs_stats.append(hs_line)
-        state.history.append(f"HS year {year}: {production} yds, {tds} TDs (Ovr {overall_before})")
+        if self.verbose:
+            state.history.append(f"HS year {year}: {production} yds, {tds} TDs (Ovr {overall_before})")
         for a in awards:
             state.awards.append({"level":"HS","year":year,"name":a})
-            state.history.append(f"HS award: {a}")
+            if self.verbose:
+                state.history.append(f"HS award: {a}")
 
         # Rating movement from performance and hidden potential
         perf_delta = (production/1000 - 1) * (0.4 + volatility*0.3)
         potential_delta = (p.hidden_potential-0.5)*0.6
         state.star_rating = max(1.0, min(5.0, state.star_rating + perf_delta + potential_delta + self.rng.uniform(-0.25*volatility,0.3)))
         growth = 1 + p.hidden_potential*2.5 + volatility*0.8
-        for k in ["speed","awareness","throw_power","route_running","break_tackle","strength"]:
-            p.attributes[k] += self.rng.uniform(0.4, growth)
+        self._grow_attributes(p, 0.4, growth)
         # Adjust hidden potential slightly based on production to mimic scouting updates
         pot_delta = (production/1200.0 - 1) * (0.05 + volatility*0.05) + self.rng.uniform(-0.03*volatility,0.03*volatility)
         p.hidden_potential = max(0.1, min(1.0, p.hidden_potential + pot_delta))
@@ -246,21 +369,13 @@ class CareerEngine:
         state.calendar = {"phase":"HS", "year":year, "week":15}
         # record post progression
         hs_line["overall_after"] = round(self._overall(p),1)
-        state.history.append(f"HS year {year} progression: {overall_before} -> {hs_line['overall_after']}")
+        if self.verbose:
+            state.history.append(f"HS year {year} progression: {overall_before} -> {hs_line['overall_after']}")
         return hs_line
 
     def _offer_count_for_rating(self, stars:float)->int:
-        # Bigger separation: 1-star (1-5), 2-star (3-10), 3-star (8-20), 4-star (15-35), 5-star (40-70)
-        if stars <= 1.5:
-            base, spread = 1, 4
-        elif stars <= 2.5:
-            base, spread = 3, 7
-        elif stars <= 3.5:
-            base, spread = 8, 12
-        elif stars <= 4.5:
-            base, spread = 15, 20
-        else:
-            base, spread = 80, 50
+        # tier i covers stars <= _OFFER_TIER_CUTS[i]; bisect_left keeps the boundaries inclusive
+        base, spread = _OFFER_TIERS[bisect.bisect_left(_OFFER_TIER_CUTS, stars)]
         return max(1, base + self.rng.randint(0, spread))
 
     def generate_college_offers(self, state:CareerState)->List[Dict[str,Any]]:
@@ -272,18 +387,25 @@ class CareerEngine:
         perf_score = max(0.2, min(2.5, perf_score))
         offers = []
         num = self._offer_count_for_rating(state.star_rating)
+        # star/production terms and tier flags are fixed for this call; hoist them out of the school loop
+        star_term = 0.35 + state.star_rating/6
+        perf_term = 0.65 + 0.35*perf_score
+        low_star = state.star_rating < 3
+        elite = state.star_rating >= 4.5
+        rand = self.rng.random
+        catalog, _, prestige_terms, low_star_mults = self._catalog_terms()
         weights = []
-        for s in self.fbs_catalog:
+        for prestige, low_star_mult in zip(prestige_terms, low_star_mults):
             # high prestige schools prefer high stars; HS stats give a bump; inject randomness to mimic scouting variance
-            desirability = s.prestige * (0.35 + state.star_rating/6) * (0.65 + 0.35*perf_score)
-            desirability *= (0.75 + self.rng.random()*0.6)
-            if state.star_rating < 3:
-                desirability *= (1.25 - s.prestige*0.55)
-            if state.star_rating >= 4.5:
+            desirability = prestige * star_term * perf_term
+            desirability *= (0.75 + rand()*0.6)
+            if low_star:
+                desirability *= low_star_mult
+            if elite:
                 desirability *= 1.35
             weights.append(max(0.01, desirability))
-        k = min(max(3, num + self.rng.randint(0,6)), len(self.fbs_catalog))
-        choices = self.rng.choices(self.fbs_catalog, weights=weights, k=k)
+        k = min(max(3, num + self.rng.randint(0,6)), len(catalog))
+        choices = self.rng.choices(catalog, weights=weights, k=k)
         seen = set()
         for c in choices:
             if c.id in seen:
@@ -291,17 +413,19 @@ class CareerEngine:
             seen.add(c.id)
             offers.append({"id": c.id, "team_name": c.name, "prestige": c.prestige, "location": c.location, "random_grade": round(self.rng.uniform(0.5,1.0),2)})
         state.college_offers = offers
-        state.history.append(f"Generated {len(offers)} college offers (max prestige {max([o['prestige'] for o in offers]) if offers else 0:.2f}).")
+        if self.verbose:
+            state.history.append(f"Generated {len(offers)} college offers (max prestige {max((o['prestige'] for o in offers), default=0):.2f}).")
         return offers
 
     def commit_to_college(self, state:CareerState, team_id:str):
         team = next((o for o in state.college_offers if o["id"]==team_id), None)
         if not team:
             raise ValueError("Offer not found")
-        state.college_team = next((s for s in self.fbs_catalog if s.id==team_id), None)
+        state.college_team = self._catalog_terms()[1].get(team_id)
         state.stage = "COLLEGE"
         state.calendar = {"phase":"COLLEGE", "year":1, "week":1}
-        state.history.append(f"Committed to {team['team_name']}.")
+        if self.verbose:
+            state.history.append(f"Committed to {team['team_name']}.")
 
     def simulate_college_year(self, state:CareerState, year:int)->Dict[str,Any]:
         if state.stage not in ("COLLEGE","NFL"):
@@ -314,31 +438,34 @@ class CareerEngine:
         if state.stage == "NFL":
             return {}
         p = state.player
-        scheme = state.college_team.scheme_bias if state.college_team else {"pass":0.5,"run":0.5}
+        scheme = state.college_team.scheme_bias if state.college_team else SchemeBias(pass_=0.5, run=0.5)
         volatility = max(0.1, (6 - state.star_rating)/8)
         usage = 95 + int(self.rng.random()*55 * (1 + volatility*0.4))
-        efficiency = (p.attributes.get("awareness",50)+p.attributes.get("speed",50))/16
+        efficiency = (p.attributes["awareness"]+p.attributes["speed"])/16
         production = int(max(400, efficiency*usage*self.rng.uniform(0.65 - 0.15*volatility,1.15 + 0.2*volatility)))
         tds = int(max(3, production/140 * self.rng.uniform(0.85,1.25)))
         rating_before = self._overall(p)
         college_line = {"year":year, "rating":round(rating_before,1), "production_yards":production, "tds":tds}
         state.college_stats.append(college_line)
-        state.history.append(f"College year {year}: rating {rating_before:.1f}, {production} yds, {tds} TDs")
+        if self.verbose:
+            state.history.append(f"College year {year}: rating {rating_before:.1f}, {production} yds, {tds} TDs")
         # possible awards
         if production > 1600 and self.rng.random()<0.35:
             state.awards.append({"level":"College","year":year,"name":"All-American"})
-            state.history.append(f"College award: All-American (Y{year})")
+            if self.verbose:
+                state.history.append(f"College award: All-American (Y{year})")
         if production > 2000 and tds > 12 and self.rng.random()<0.2:
             state.awards.append({"level":"College","year":year,"name":"Heisman"})
-            state.history.append(f"College award: Heisman (Y{year})")
+            if self.verbose:
+                state.history.append(f"College award: Heisman (Y{year})")
         if production > 2200 and tds > 18 and self.rng.random()<0.15:
             state.awards.append({"level":"College","year":year,"name":"Maxwell"})
-            state.history.append(f"College award: Maxwell (Y{year})")
+            if self.verbose:
+                state.history.append(f"College award: Maxwell (Y{year})")
 
         # development
         dev = 1.5 + p.hidden_potential*3 + volatility*0.9
-        for k in ["speed","awareness","throw_power","route_running","break_tackle","strength"]:
-            p.attributes[k] += self.rng.uniform(0.6, dev)
+        self._grow_attributes(p, 0.6, dev)
         # potential and overall nudged by performance
         pot_delta = (production/1400.0 - 1) * (0.06 + 0.03*volatility) + self.rng.uniform(-0.03*volatility,0.03*volatility)
         p.hidden_potential = max(0.1, min(1.0, p.hidden_potential + pot_delta))
@@ -347,7 +474,8 @@ class CareerEngine:
         state.calendar = {"phase":"COLLEGE", "year":year, "week":14}
         # record post progression
         college_line["rating_after"] = round(self._overall(p),1)
-        state.history.append(f"College year {year} progression: {rating_before:.1f} -> {college_line['rating_after']:.1f}")
+        if self.verbose:
+            state.history.append(f"College year {year} progression: {rating_before:.1f} -> {college_line['rating_after']:.1f}")
 
         # early draft declaration for high performers
         if rating_before > 84 and year >= 2 and self.rng.random() < 0.4:
@@ -356,9 +484,20 @@ class CareerEngine:
             self.promote_to_nfl(state)
         return college_line
 
+    def _grow_attributes(self, player:Player, low:float, high:float):
+        # one uniform(low, high) bump per GROWTH_KEYS entry, spelled out so the span and bound draw are computed once
+        attrs = player.attributes
+        rand = self.rng.random
+        span = high - low
+        for k in GROWTH_KEYS:
+            attrs[k] += low + span*rand()
+
     def _overall(self, player:Player)->float:
-        keys = ["speed","strength","awareness","throw_power","route_running","break_tackle"]
-        return statistics.mean([player.attributes.get(k,50) for k in keys])
+        attrs = player.attributes
+        total = 0.0
+        for k in OVERALL_KEYS:
+            total += attrs[k]
+        return total/len(OVERALL_KEYS)
 
     def promote_to_nfl(self, state:CareerState):
         rating = self._overall(state.player)
@@ -372,27 +511,31 @@ class CareerEngine:
         elif rating > 76:
             draft_tier = "Rounds 6-7"
         state.draft_projection = draft_tier
-        possible = [f.city for f in build_nfl_franchises()]
-        state.nfl_team = self.rng.choice(possible)
+        state.nfl_team = self.rng.choice(_NFL_CITIES)
         state.stage = "NFL"
         state.calendar = {"phase":"NFL", "year": state.calendar.get("year",4)+1, "week":1}
-        state.history.append(f"Draft outcome: {draft_tier}, landed with {state.nfl_team}.")
+        if self.verbose:
+            state.history.append(f"Draft outcome: {draft_tier}, landed with {state.nfl_team}.")
 
     def simulate_nfl_seasons(self, state:CareerState, seasons:int=3)->List[Dict[str,Any]]:
         """Lightweight NFL stat generator driven by player overall."""
         stats=[]
+        rng = self.rng
         base_rating = self._overall(state.player)
         declines = 0
+        # potential and the attributes read below don't change across NFL years; hoist them
+        dev = 0.4 + state.player.hidden_potential*0.8
+        int_factor = 1.1 - state.player.attributes["awareness"]/120
+        rush_base = state.player.attributes["speed"]-40
+        prev = None
         for yr in range(1, seasons+1):
-            dev = 0.4 + state.player.hidden_potential*0.8
-            base_rating += self.rng.uniform(-0.8, dev)
-            usage = 450 + int(self.rng.random()*120)
-            efficiency = 6.0 + (base_rating-70)/12 + self.rng.uniform(-0.6,0.8)
+            base_rating += rng.uniform(-0.8, dev)
+            usage = 450 + int(rng.random()*120)
+            efficiency = 6.0 + (base_rating-70)/12 + rng.uniform(-0.6,0.8)
             pass_yards = max(1800, int(usage*efficiency))
-            pass_tds = max(8, int(pass_yards/180 + self.rng.randint(-2,5)))
-            ints = max(3, int(pass_tds/2.5 * (1.1 - state.player.attributes.get("awareness",50)/120)) + self.rng.randint(-2,3))
-            rush_yards = max(50, int((state.player.attributes.get("speed",50)-40) * self.rng.uniform(4,10)))
-            prev = stats[-1] if stats else None
+            pass_tds = max(8, int(pass_yards/180 + rng.randint(-2,5)))
+            ints = max(3, int(pass_tds/2.5 * int_factor) + rng.randint(-2,3))
+            rush_yards = max(50, int(rush_base * rng.uniform(4,10)))
             if prev and pass_yards < prev["pass_yards"] and pass_tds < prev["pass_tds"] and base_rating < prev["overall"]:
                 declines += 1
             else:
@@ -406,23 +549,31 @@ class CareerEngine:
                 "rush_yards": rush_yards
             }
             stats.append(statline)
-            state.history.append(f"NFL year {yr}: Ovr {statline['overall']}, {pass_yards} pass yds, {pass_tds} TD, {ints} INT")
-            if pass_yards > 4500 and pass_tds >= 25 and self.rng.random()<0.4:
+            prev = statline
+            if self.verbose:
+                state.history.append(f"NFL year {yr}: Ovr {statline['overall']}, {pass_yards} pass yds, {pass_tds} TD, {ints} INT")
+            mvp = pass_yards > 4500 and pass_tds >= 25 and rng.random()<0.4
+            if mvp:
                 state.awards.append({"level":"NFL","year":yr,"name":"MVP"})
-                state.history.append(f"NFL award: MVP (Y{yr})")
-            if pass_yards > 3500 and self.rng.random()<0.5:
+                if self.verbose:
+                    state.history.append(f"NFL award: MVP (Y{yr})")
+            if pass_yards > 3500 and rng.random()<0.5:
                 state.awards.append({"level":"NFL","year":yr,"name":"Pro Bowl"})
-                state.history.append(f"NFL award: Pro Bowl (Y{yr})")
-            if (pass_yards > 4800 and pass_tds > 30 and self.rng.random()<0.25) or ((any(a for a in state.awards if a["level"]=="NFL" and a["year"]==yr and a["name"]=="MVP")) and self.rng.random()<0.5):
+                if self.verbose:
+                    state.history.append(f"NFL award: Pro Bowl (Y{yr})")
+            if (pass_yards > 4800 and pass_tds > 30 and rng.random()<0.25) or (mvp and rng.random()<0.5):
                 state.awards.append({"level":"NFL","year":yr,"name":"All-Pro"})
-                state.history.append(f"NFL award: All-Pro (Y{yr})")
-            if pass_yards > 4000 and pass_tds > 20 and self.rng.random()<0.2:
+                if self.verbose:
+                    state.history.append(f"NFL award: All-Pro (Y{yr})")
+            if pass_yards > 4000 and pass_tds > 20 and rng.random()<0.2:
                 state.awards.append({"level":"NFL","year":yr,"name":"Super Bowl"})
-                state.history.append(f"NFL award: Super Bowl Champion (Y{yr})")
-            if yr >= 12 and declines >= 2 and self.rng.random() < 0.6:
+                if self.verbose:
+                    state.history.append(f"NFL award: Super Bowl Champion (Y{yr})")
+            if yr >= 12 and declines >= 2 and rng.random() < 0.6:
                 state.retired = True
                 state.retired_year = yr
-                state.history.append(f"Retired after year {yr} due to decline.")
+                if self.verbose:
+                    state.history.append(f"Retired after year {yr} due to decline.")
                 break
         return stats
 
@@ -446,153 +597,337 @@ def build_nfl_franchises()->List[NflFranchise]:
         franchises.append(NflFranchise(id=abbr, name=name, city=city, prestige=prestige))
     return franchises
 
+# built once at import; NflFranchise is frozen with only immutable fields, so drivers and engines share these
+_NFL_FRANCHISES = tuple(build_nfl_franchises())
+_NFL_CITIES = tuple(f.city for f in _NFL_FRANCHISES)
+
 
 # ---------------------------
 # Raw Event / Provenance Log
 # ---------------------------
+PLAY_PASS, PLAY_RUN = 0, 1
+PLAY_TYPE_CODES = {"pass":PLAY_PASS, "run":PLAY_RUN}
+PLAY_TYPE_NAMES = {code:name for name,code in PLAY_TYPE_CODES.items()}
+
+@dataclass(slots=True)
+class PlayEvent:
+    """One resolved play as returned by PlayResolver.resolve_play; game context is filled in by the game loop."""
+    play_type: str
+    offense_team: str
+    defense_team: str
+    primary_player_id: str
+    involved_ids: Tuple[str,...]
+    result: Dict[str,Any]
+    game_id: Optional[str] = None
+    quarter: int = 0
+    drive_index: int = 0
+    offense_is_home: bool = False
+
 class EventLog:
-    def __init__(self):
-        self.events: List[Dict[str,Any]] = []
+    """
+    Columnar play log: one typed array per field (plain lists for id strings) rather
+    than a dict per play. Rows are appended by log(), concatenated with extend(), and
+    read column-wise by StatAggregator; to_dicts() rebuilds per-play dicts on demand.
+    """
+    # every per-row column, in to_dicts() order; notes is a sparse {row: text} side table
+    COLUMNS = ("play_type","offense_team","defense_team","primary_player_id",
+               "complete","yards","td","interception","pressure","yac","broken_tackles","injury",
+               "game_id","quarter","drive_index","offense_is_home","event_id","ts")
 
-    def log(self, ev:Dict[str,Any]):
-        # Attach uuid and timestamp for traceability
-        ev2 = dict(ev)
-        ev2["event_id"] = str(uuid.uuid4())
-        ev2["ts"] = datetime.datetime.utcnow().isoformat()
-        self.events.append(ev2)
-        return ev2["event_id"]
+    def __init__(self):
+        self.play_type = array("b")
+        self.offense_team: List[str] = []
+        self.defense_team: List[str] = []
+        self.primary_player_id: List[str] = []
+        self.complete = bytearray()
+        self.yards = array("i")
+        self.td = bytearray()
+        self.interception = bytearray()
+        self.pressure = bytearray()
+        self.yac = array("i")
+        self.broken_tackles = array("b")
+        self.injury: List[Optional[str]] = []
+        self.game_id: List[Optional[str]] = []
+        self.quarter = array("b")
+        self.drive_index = array("b")
+        self.offense_is_home = bytearray()
+        self.event_id = array("q")
+        self.ts = array("q")
+        self.notes: Dict[int,str] = {}
+        self._ctr = itertools.count()
+
+    def __len__(self):
+        return len(self.event_id)
+
+    def log(self, ev:PlayEvent):
+        """
+        Append one play event as a row, stamped with a wall-clock ns and a sequence id that is
+        unique within this log (returned). ev itself is not retained.
+        """
+        res = ev.result
+        if "notes" in res:
+            self.notes[len(self)] = res["notes"]
+        self.play_type.append(PLAY_TYPE_CODES.get(ev.play_type, -1))
+        self.offense_team.append(ev.offense_team)
+        self.defense_team.append(ev.defense_team)
+        self.primary_player_id.append(ev.primary_player_id)
+        self.complete.append(1 if res.get("complete") else 0)
+        self.yards.append(int(res.get("yards",0)))
+        self.td.append(1 if res.get("td") else 0)
+        self.interception.append(1 if res.get("interception") else 0)
+        self.pressure.append(1 if res.get("pressure") else 0)
+        self.yac.append(res.get("yac",0))
+        self.broken_tackles.append(res.get("broken_tackles",0))
+        self.injury.append(res.get("injury"))
+        self.game_id.append(ev.game_id)
+        self.quarter.append(ev.quarter)
+        self.drive_index.append(ev.drive_index)
+        self.offense_is_home.append(1 if ev.offense_is_home else 0)
+        event_id = next(self._ctr)
+        self.event_id.append(event_id)
+        self.ts.append(time.time_ns())
+        return event_id
+
+    def extend(self, other:"EventLog"):
+        """
+        Append all rows of another log (e.g. a finished game's) to this one. The appended rows
+        get fresh ids from this log's sequence, so event_id stays unique in the merged log.
+        """
+        base = len(self)
+        for col in self.COLUMNS:
+            if col == "event_id":
+                self.event_id.extend(itertools.islice(self._ctr, len(other)))
+            else:
+                getattr(self, col).extend(getattr(other, col))
+        for row, note in other.notes.items():
+            self.notes[base + row] = note
+
+    def to_dicts(self)->List[Dict[str,Any]]:
+        """Per-play dict view (the pre-columnar event shape), e.g. for JSON dumps."""
+        out = []
+        for i in range(len(self)):
+            code = self.play_type[i]
+            if code == PLAY_PASS:
+                result = {"complete": bool(self.complete[i]), "yards": self.yards[i], "td": bool(self.td[i]),
+                          "interception": bool(self.interception[i]), "pressure": bool(self.pressure[i]),
+                          "yac": self.yac[i], "injury": self.injury[i]}
+            elif code == PLAY_RUN:
+                result = {"yards": self.yards[i], "td": bool(self.td[i]),
+                          "broken_tackles": self.broken_tackles[i], "injury": self.injury[i]}
+            else:
+                result = {"complete": False, "yards": 0}
+            if i in self.notes:
+                result["notes"] = self.notes[i]
+            pid = self.primary_player_id[i]
+            out.append({
+                "play_type": PLAY_TYPE_NAMES.get(code, "unknown"),
+                "offense_team": self.offense_team[i],
+                "defense_team": self.defense_team[i],
+                "primary_player_id": pid,
+                "involved_ids": (pid,),
+                "result": result,
+                "game_id": self.game_id[i],
+                "quarter": self.quarter[i],
+                "drive_index": self.drive_index[i],
+                "offense_is_home": bool(self.offense_is_home[i]),
+                "event_id": self.event_id[i],
+                "ts": self.ts[i],
+            })
+        return out
 
-    def dump(self):
-        return list(self.events)
+    def dump(self, format_ts:bool=False):
+        """
+        to_dicts(), optionally with ts rendered as a naive UTC ISO string (the format
+        apply_game_result stamps injuries with). Formatting happens only here, never in log().
+        """
+        out = self.to_dicts()
+        if format_ts:
+            epoch = datetime.datetime(1970, 1, 1)
+            for d in out:
+                d["ts"] = (epoch + datetime.timedelta(microseconds=d["ts"] // 1000)).isoformat()
+        return out
 
 # ---------------------------
 # Core Simulation: play resolution
 # ---------------------------
+# Logistic lookup table over [-6, 6]; pressure arguments stay well inside this band and
+# the result is only compared against a uniform draw, so nearest-entry accuracy is ample.
+_LOGISTIC_SIZE = 1024
+_LOGISTIC_SPAN = 6.0
+_LOGISTIC_SCALE = (_LOGISTIC_SIZE - 1) / (2 * _LOGISTIC_SPAN)
+_LOGISTIC_TABLE = tuple(1.0 / (1.0 + math.exp(-(i / _LOGISTIC_SCALE - _LOGISTIC_SPAN))) for i in range(_LOGISTIC_SIZE))
+
+def _logistic(x):
+    i = int((x + _LOGISTIC_SPAN) * _LOGISTIC_SCALE + 0.5)
+    return _LOGISTIC_TABLE[min(_LOGISTIC_SIZE - 1, max(0, i))]
+
+def _resolve_pass_core(rng, qb_awareness, qb_throw_power, route_running, catching, speed, break_tackle,
+                       coverage, rush, rating_diff, depth):
+    """
+    Numeric pass-play kernel: scalars in, fixed-width tuple out.
+    Returns (yards, td, complete, interception, pressure, yac, injured).
+    """
+    rand = rng.random
+    qb_acc = qb_awareness * 0.6 + qb_throw_power * 0.4
+    target_skill = route_running*0.6 + catching*0.4
+    # pressure factor from pass rush (DL)
+    pressure_prob = _logistic((rush - qb_awareness)/20.0)
+    pressure = rand() < pressure_prob
+
+    # base prob
+    prob = 0.40 + (qb_acc-50)/220 + (target_skill-50)/320 - (coverage-50)/210 + rating_diff*0.1
+    if pressure:
+        prob -= 0.10
+    # clamp
+    prob = max(0.03, min(0.95, prob))
+    complete = rand() < prob
+
+    # yards model
+    yac = 0
+    if complete:
+        yac = max(0, int((break_tackle/55.0) * (rand()*8)))
+        # yard gain is depth +/- variation + yac
+        yard_variation = int((target_skill-50)/10) + rng.randint(-2,14)
+        yards = max(0, depth + yard_variation + yac)
+        td = yards >= 35 and rand() < 0.06 + (speed-50)/220.0
+        interception = False
+    else:
+        yards = 0
+        td = False
+        # chance interception on badly thrown passes
+        int_volatility = 0.02 + (coverage-50)/400 + rng.uniform(0,0.07)
+        int_volatility += max(0, (55 - qb_awareness)/200)
+        interception = (rand() < int_volatility) or (rand() < 0.03 and prob < 0.15)
+
+    # injuries chance from collisions on receptions or tackles
+    injured = complete and rand() < 0.005
+    return yards, bool(td), complete, bool(interception), pressure, yac, injured
+
+def _resolve_run_core(rng, break_tackle, speed, line_strength, def_front, rating_diff):
+    """
+    Numeric run-play kernel. Returns (yards, td, broken_tackles, injured).
+    """
+    rand = rng.random
+    run_skill = break_tackle*0.6 + speed*0.4
+    base = max(0, int((run_skill - def_front)/10) + int(line_strength/50) + rng.randint(-1,10) + int(rating_diff*5))
+    yards = max(0, base + rng.randint(0,10))
+    td = yards >= 60 and rand() < 0.08 + max(0, rating_diff*0.07)
+    broken_tackles = int((break_tackle-40)/15) if yards>3 else 0
+    injured = rand() < 0.004
+    return yards, bool(td), broken_tackles, injured
+
+# simple injury model: names and cumulative weights (0.6, 0.2, 0.18, 0.02)
+_INJURIES = ("hamstring","concussion","sprain","torn_acl")
+_INJURY_CDF = tuple(itertools.accumulate((0.6, 0.2, 0.18, 0.02)))
+
 class PlayResolver:
     def __init__(self, rng: random.Random):
         self.rng = rng
 
-    def _mean(self, values, default=50):
-        return statistics.mean(values) if values else default
-
-    def resolve_play(self, play_call:Dict[str,Any], offense:Team, defense:Team)->Dict[str,Any]:
+    def resolve_play(self, play_call:Dict[str,Any], offense:Team, defense:Team,
+                     rating_diff:Optional[float]=None)->PlayEvent:
         """
         Simplified micro-resolution:
         play_call: {"type":"pass"/"run","primary":Player}
-        returns raw event dict capturing outcome and involved players.
+        rating_diff: (offense - defense) overall rating / 50; derived from the teams when omitted
+        returns a PlayEvent capturing outcome and involved players.
+        Dispatches to resolve_pass/resolve_run; the game loop calls those directly.
         """
         off_player:Player = play_call["primary"]
         play_type = play_call["type"]
-        base_yards = 0
-        ev = {
-            "play_type": play_type,
-            "offense_team": offense.id,
-            "defense_team": defense.id,
-            "primary_player_id": off_player.id,
-            "involved_ids": [p.id for p in [off_player]],
-            "result": {}
-        }
-
-        # fatigue and morale modifiers
-        off_effect = (off_player.attributes.get("awareness",50)/50.0) * (1 - off_player.fatigue)
-        team_coach = offense.coach_quality
-        def_effect = (defense.coach_quality if hasattr(defense,'coach_quality') else 0.5)
-        off_rating = team_rating(offense)
-        def_rating = team_rating(defense)
-        rating_diff = (off_rating - def_rating) / 50.0
-
+        # resolve_pass/resolve_run read Team.agg directly, so make sure both teams have one
+        for team in (offense, defense):
+            if not team.agg:
+                team.refresh_aggregates()
+        if rating_diff is None:
+            rating_diff = (offense.agg["overall_rating"] - defense.agg["overall_rating"]) / 50.0
         if play_type == "pass":
-            # compute completion chance
-            qb = next((p for p in offense.roster if p.position=="QB"), None)
-            target = off_player
-            if qb is None or target is None:
-                # failed safe
-                ev["result"] = {"complete": False, "yards": 0, "td": False, "interception": False, "notes":"no qb/target"}
-                return ev
-
-            qb_acc = qb.attributes.get("awareness",50) * 0.6 + qb.attributes.get("throw_power",50) * 0.4
-            target_skill = target.attributes.get("route_running",50)*0.6 + target.attributes.get("catching",50)*0.4
-            coverage = self._mean([p.attributes.get("awareness",50) for p in defense.roster if p.position in ("DB","LB")], default=50)
-            # pressure factor from pass rush (DL)
-            rush = self._mean([p.attributes.get("strength",50) for p in defense.roster if p.position in ("DL",)], default=50)
-            pressure_prob = self._logistic((rush - qb.attributes.get("awareness",50))/20.0)
-            pressure = self.rng.random() < pressure_prob
-
-            # base prob
-            prob = 0.40 + (qb_acc-50)/220 + (target_skill-50)/320 - (coverage-50)/210 + rating_diff*0.1
-            if pressure:
-                prob -= 0.10
-            # clamp
-            prob = max(0.03, min(0.95, prob))
-            complete = self.rng.random() < prob
-
-            # yards model
-            depth = play_call.get("depth", 8 + int((target.attributes.get("speed",50)-50)/6)) # simple depth heuristic
-            yac = 0
-            if complete:
-                yac = max(0, int((target.attributes.get("break_tackle",50)/55.0) * (self.rng.random()*8)))
-                # yard gain is depth +/- variation + yac
-                yard_variation = int((target_skill-50)/10) + self.rng.randint(-2,14)
-                yards = max(0, depth + yard_variation + yac)
-                td = yards >= 35 and self.rng.random() < 0.06 + (target.attributes.get("speed",50)-50)/220.0
-                interception = False
-            else:
-                yards = 0
-                td = False
-                # chance interception on badly thrown passes
-                int_volatility = 0.02 + (coverage-50)/400 + self.rng.uniform(0,0.07)
-                qb_awareness = qb.attributes.get("awareness",50)
-                int_volatility += max(0, (55 - qb_awareness)/200)
-                interception = (self.rng.random() < int_volatility) or (self.rng.random() < 0.03 and prob < 0.15)
-
-            # injuries chance from collisions on receptions or tackles
-            injury = None
-            if complete and self.rng.random() < 0.005:
-                injury = self._sample_injury()
-
-            ev["result"] = {"complete": complete, "yards": yards, "td": bool(td), "interception": bool(interception), "pressure": pressure, "yac": yac, "injury": injury}
-            return ev
-
+            return self.resolve_pass(off_player, offense, defense, rating_diff, play_call.get("depth"))
         elif play_type == "run":
-            runner = off_player
-            run_skill = runner.attributes.get("break_tackle",50)*0.6 + runner.attributes.get("speed",50)*0.4
-            line_strength = self._mean([p.attributes.get("strength",50) for p in offense.roster if p.position in ("OL",)], default=50)
-            def_front = self._mean([p.attributes.get("strength",50) for p in defense.roster if p.position in ("DL","LB")], default=50)
-            base = max(0, int((run_skill - def_front)/10) + int(line_strength/50) + self.rng.randint(-1,10) + int(rating_diff*5))
-            yards = max(0, base + self.rng.randint(0,10))
-            td = yards >= 60 and self.rng.random() < 0.08 + max(0, rating_diff*0.07)
-            broken_tackles = int((runner.attributes.get("break_tackle",50)-40)/15) if yards>3 else 0
-            injury = None
-            if self.rng.random() < 0.004:
-                injury = self._sample_injury()
-            ev["result"] = {"yards": yards, "td": bool(td), "broken_tackles": broken_tackles, "injury": injury}
-            return ev
-
+            return self.resolve_run(off_player, offense, defense, rating_diff)
         else:
-            ev["result"] = {"complete": False, "yards":0, "notes":"unknown play"}
-            return ev
+            return PlayEvent(play_type, offense.id, defense.id, off_player.id, (off_player.id,),
+                             {"complete": False, "yards":0, "notes":"unknown play"})
 
-    def _logistic(self, x):
-        return 1.0 / (1.0 + math.exp(-x))
+    def resolve_pass(self, target:Player, offense:Team, defense:Team, rating_diff:float,
+                     depth:Optional[int]=None)->PlayEvent:
+        """
+        Pass to target; depth defaults to a speed-based heuristic. Reads offense.agg and
+        defense.agg directly, so both must be refreshed (play_game does so at kickoff).
+        """
+        qb = offense.agg["qb"]
+        if qb is None:
+            # failed safe
+            return PlayEvent("pass", offense.id, defense.id, target.id, (target.id,),
+                             {"complete": False, "yards": 0, "td": False, "interception": False, "notes":"no qb/target"})
+
+        qa = qb.attributes
+        ta = target.attributes
+        if depth is None:
+            depth = 8 + int((ta["speed"]-50)/6) # simple depth heuristic
+        yards, td, complete, interception, pressure, yac, injured = _resolve_pass_core(
+            self.rng, qa["awareness"], qa["throw_power"],
+            ta["route_running"], ta["catching"], ta["speed"], ta["break_tackle"],
+            defense.agg["def_coverage_mean"], defense.agg["def_rush_mean"], rating_diff, depth)
+        injury = self._sample_injury() if injured else None
+        return PlayEvent("pass", offense.id, defense.id, target.id, (target.id,),
+                         {"complete": complete, "yards": yards, "td": td, "interception": interception, "pressure": pressure, "yac": yac, "injury": injury})
+
+    def resolve_run(self, carrier:Player, offense:Team, defense:Team, rating_diff:float)->PlayEvent:
+        """Designed run by carrier behind offense's line; like resolve_pass, needs refreshed Team.agg."""
+        ra = carrier.attributes
+        yards, td, broken_tackles, injured = _resolve_run_core(
+            self.rng, ra["break_tackle"], ra["speed"],
+            offense.agg["off_line_mean"], defense.agg["def_front_mean"], rating_diff)
+        injury = self._sample_injury() if injured else None
+        return PlayEvent("run", offense.id, defense.id, carrier.id, (carrier.id,),
+                         {"yards": yards, "td": td, "broken_tackles": broken_tackles, "injury": injury})
 
     def _sample_injury(self):
-        # simple injury sampling
-        injuries = ["hamstring","concussion","sprain","torn_acl"]
-        weights = [0.6, 0.2, 0.18, 0.02]
-        return self.rng.choices(injuries, weights)[0]
+        # simple injury sampling: one draw against the precomputed CDF (same result as rng.choices)
+        return _INJURIES[bisect.bisect_right(_INJURY_CDF, self.rng.random() * _INJURY_CDF[-1], 0, len(_INJURY_CDF) - 1)]
 
 # ---------------------------
 # Game & Season Simulation
 # ---------------------------
 class GameSimulator:
-    def __init__(self, rng: random.Random):
+    def __init__(self, rng: random.Random, record_injury_detail:bool=False):
         self.rng = rng
+        # passed to apply_game_result by simulate_game
+        self.record_injury_detail = record_injury_detail
         self.resolver = PlayResolver(rng)
         self.log = EventLog()
 
+    def _play_candidates(self, team:Team):
+        """
+        (run candidates, pass candidates) as fixed tuples in roster order, with the
+        positional fallbacks applied. Sampled with rng.choice, i.e. a single bounded
+        index draw per play.
+        """
+        rushers = [pl for pl in team.roster if pl.pos_code==POS_RB]
+        if not rushers:
+            rushers = [pl for pl in team.roster if pl.pos_code in (POS_FB,POS_WR)]
+        receivers = [pl for pl in team.roster if pl.pos_code in (POS_WR,POS_TE)]
+        if not receivers:
+            receivers = [pl for pl in team.roster if pl.pos_code==POS_RB]
+        return tuple(rushers), tuple(receivers)
+
     def simulate_game(self, home:Team, away:Team)->Dict[str,Any]:
         """
-        Simplified: 4 quarters, each team gets set number of drives (~8), drives produce points
+        Play a game, fold the result into both teams (season stats, injuries) and append its
+        plays to self.log.
+        """
+        game_record = self.play_game(home, away)
+        apply_game_result(game_record, home, away, self.record_injury_detail)
+        self.log.extend(game_record["plays"])
+        return game_record
+
+    def play_game(self, home:Team, away:Team)->Dict[str,Any]:
+        """
+        Simplified: 4 quarters, each team gets set number of drives (~8), drives produce points.
+        Season stats and injuries are left untouched: the score, plays and any injuries land on
+        the returned game record, to be applied with apply_game_result(); self.log is left alone.
+        The only team state written is the cached Team.agg, rebuilt for both teams at kickoff.
         """
         game_id = str(uuid.uuid4())
         game_record = {
@@ -601,152 +936,192 @@ class GameSimulator:
             "home_name":home.name,
             "away_id":away.id,
             "away_name":away.name,
-            "plays":[],
-            "score":{"home":0,"away":0}
+            # each game owns its log: it is the unit play_games ships back from pool workers
+            "plays":EventLog(),
+            "score":{"home":0,"away":0},
+            "injuries":[]
         }
-        # seed-specific rng for this game determinism
+        # seed-specific rng for this game determinism; bind the draw methods once for the play loop
+        rand = self.rng.random
+        randint = self.rng.randint
+        choice = self.rng.choice
+        resolve_pass = self.resolver.resolve_pass
+        resolve_run = self.resolver.resolve_run
+        plays = game_record["plays"]
+        score = game_record["score"]
+        injuries = game_record["injuries"]
+        # rosters are fixed for the game; rebuild cached aggregates once at kickoff
+        home.refresh_aggregates()
+        away.refresh_aggregates()
+        # ball-carrier pools, scheme bias and ratings don't change within a game, so each side's
+        # drive constants (pools, run threshold, rating diff, TD/FG conversion odds) are built once
+        rd_home_off = (home.agg["overall_rating"] - away.agg["overall_rating"]) / 50.0
+        rd_away_off = -rd_home_off
+        home_side = (*self._play_candidates(home), home.scheme_bias.get("run",0.5),
+                     rd_home_off, 0.55 + rd_home_off*0.05, 0.30 + rd_home_off*0.04)
+        away_side = (*self._play_candidates(away), away.scheme_bias.get("run",0.5),
+                     rd_away_off, 0.55 + rd_away_off*0.05, 0.30 + rd_away_off*0.04)
         for quarter in range(1,5):
             drives_per_quarter = 3
             for d in range(drives_per_quarter):
                 # choose offense
                 offense = home if ((d + quarter) % 2 == 0) else away
                 defense = away if offense is home else home
-                rating_diff = (team_rating(offense) - team_rating(defense)) / 50.0
+                run_candidates, pass_candidates, run_threshold, rating_diff, td_p, fg_p = home_side if offense is home else away_side
                 # simple drive: choose a sequence of plays
-                plays_in_drive = self.rng.randint(4,10)
+                plays_in_drive = randint(4,10)
                 drive_yards = 0
                 drive_score = 0
                 for pnum in range(plays_in_drive):
                     # choose play type biased by offense scheme
-                    roll = self.rng.random()
-                    play_type = "run" if roll < offense.scheme_bias.get("run",0.5) else "pass"
+                    is_run = rand() < run_threshold
                     # pick primary player depending on play type
-                    if play_type == "run":
-                        candidates = [pl for pl in offense.roster if pl.position=="RB"]
-                        if not candidates:
-                            candidates = [pl for pl in offense.roster if pl.position in ("FB","WR")]
-                    else:
-                        candidates = [pl for pl in offense.roster if pl.position in ("WR","TE")]
-                        if not candidates:
-                            candidates = [pl for pl in offense.roster if pl.position=="RB"]
+                    candidates = run_candidates if is_run else pass_candidates
                     if not candidates:
                         # no appropriate player: skip
                         continue
-                    primary = self.rng.choice(candidates)
-                    play_call = {"type":play_type, "primary":primary, "depth":6}
-                    ev = self.resolver.resolve_play(play_call, offense, defense)
-                    ev["game_id"] = game_id
-                    ev["quarter"] = quarter
-                    ev["drive_index"] = d
-                    ev["offense_is_home"] = (offense is home)
-                    self.log.log(ev)
-                    game_record["plays"].append(ev)
-                    # update drive stat summary
-                    outcome = ev["result"]
-                    if play_type=="pass":
-                        if outcome.get("complete"):
-                            drive_yards += int(outcome.get("yards",0))
-                        if outcome.get("td"):
-                            # touchdown worth 7
-                            drive_score += 7
+                    primary = choice(candidates)
+                    if is_run:
+                        ev = resolve_run(primary, offense, defense, rating_diff)
                     else:
-                        drive_yards += int(outcome.get("yards",0))
-                        if outcome.get("td"):
-                            drive_score += 7
-                    # injury apply
+                        ev = resolve_pass(primary, offense, defense, rating_diff, 6)
+                    ev.game_id = game_id
+                    ev.quarter = quarter
+                    ev.drive_index = d
+                    ev.offense_is_home = (offense is home)
+                    plays.log(ev)
+                    # update drive stat summary (incomplete passes carry 0 yards)
+                    outcome = ev.result
+                    drive_yards += int(outcome.get("yards",0))
+                    if outcome.get("td"):
+                        # touchdown worth 7
+                        drive_score += 7
+                    # injuries are applied to the player after the game
                     if outcome.get("injury"):
-                        primary.injuries.append({"injury":outcome.get("injury"), "when":datetime.datetime.utcnow().isoformat()})
-                        primary.career_events.append({"type":"injury","injury":outcome.get("injury"), "game_id":game_id})
+                        injuries.append({"player_id":primary.id, "injury":outcome.get("injury")})
                 # end drive - possible field goal or touchdown
-                # simple scoring chance
                 # redzone conversion if enough yards accumulated but no td/fg yet
-                if drive_score==0 and drive_yards >= 65 and self.rng.random() < 0.55 + rating_diff*0.05:
+                if drive_score==0 and drive_yards >= 65 and rand() < td_p:
                     drive_score = 7
-                elif drive_score==0 and drive_yards >= 45 and self.rng.random() < 0.30 + rating_diff*0.04:
+                elif drive_score==0 and drive_yards >= 45 and rand() < fg_p:
                     drive_score = 3
-
-                if drive_score>0:
-                    # assign to offense
-                    if offense is home:
-                        game_record["score"]["home"] += drive_score
-                        home.season_stats["points_for"] += drive_score
-                        away.season_stats["points_against"] += drive_score
-                    else:
-                        game_record["score"]["away"] += drive_score
-                        away.season_stats["points_for"] += drive_score
-                        home.season_stats["points_against"] += drive_score
-                else:
-                    # maybe settle for a FG with reasonable chance but based on yards
-                    if drive_yards > 35 and self.rng.random() < 0.7:
-                        fg = 3
-                        if offense is home:
-                            game_record["score"]["home"] += fg
-                            home.season_stats["points_for"] += fg
-                            away.season_stats["points_against"] += fg
-                        else:
-                            game_record["score"]["away"] += fg
-                            away.season_stats["points_for"] += fg
-                            home.season_stats["points_against"] += fg
-
-        # finalize winner
-        if game_record["score"]["home"] > game_record["score"]["away"]:
-            home.season_stats["wins"] += 1
-            away.season_stats["losses"] += 1
-        elif game_record["score"]["away"] > game_record["score"]["home"]:
-            away.season_stats["wins"] += 1
-            home.season_stats["losses"] += 1
-        else:
-            # tie -> half win each in this simple model
-            home.season_stats["wins"] += 0
-            away.season_stats["wins"] += 0
+                # maybe settle for a FG with reasonable chance but based on yards
+                elif drive_score==0 and drive_yards > 35 and rand() < 0.7:
+                    drive_score = 3
+                # one score write per drive, credited to the offense
+                if drive_score:
+                    score["home" if offense is home else "away"] += drive_score
         return game_record
 
+def apply_game_result(game_record:Dict[str,Any], home:Team, away:Team, record_injury_detail:bool=False):
+    """
+    Fold a played game's score, W/L and injuries into the two teams. Injuries always bump
+    Player.injury_count; the timestamped injuries/career_events records are only written
+    with record_injury_detail.
+    """
+    home_pts = game_record["score"]["home"]
+    away_pts = game_record["score"]["away"]
+    hs, aws = home.stats, away.stats
+    hs.points_for += home_pts
+    hs.points_against += away_pts
+    aws.points_for += away_pts
+    aws.points_against += home_pts
+    # finalize winner; a tie leaves W/L untouched in this simple model
+    if home_pts > away_pts:
+        hs.wins += 1
+        aws.losses += 1
+    elif away_pts > home_pts:
+        aws.wins += 1
+        hs.losses += 1
+    if game_record["injuries"]:
+        players = {p.id:p for p in itertools.chain(home.roster, away.roster)}
+        when = datetime.datetime.utcnow().isoformat() if record_injury_detail else None
+        for inj in game_record["injuries"]:
+            p = players[inj["player_id"]]
+            p.injury_count += 1
+            if record_injury_detail:
+                p.injuries.append({"injury":inj["injury"], "when":when})
+                p.career_events.append({"type":"injury","injury":inj["injury"], "game_id":game_record["game_id"]})
+
+def _pool_map(fn, items:List[Any], workers:Optional[int]=None)->List[Any]:
+    # Ordered map of a picklable module-level fn: across a process pool when workers > 1, inline otherwise.
+    if workers and workers > 1 and len(items) > 1:
+        chunk = max(1, len(items) // (workers * 4))
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(fn, items, chunksize=chunk))
+    return [fn(x) for x in items]
+
+def _play_game_task(matchup):
+    # Worker entry point: (home, away, seed) -> (game_record, events). Module-level so it pickles.
+    home, away, seed = matchup
+    gs = GameSimulator(random.Random(seed))
+    game_record = gs.play_game(home, away)
+    return game_record, game_record["plays"]
+
+def play_games(matchups:List[tuple], workers:Optional[int]=None)->List[tuple]:
+    """
+    Play independent (home, away, seed) matchups and return [(game_record, EventLog)] in
+    matchup order. Each game draws only from its own seed, so results are identical inline
+    or across a process pool of `workers`. Teams are not mutated; apply results with
+    apply_game_result().
+    """
+    return _pool_map(_play_game_task, matchups, workers)
+
 # ---------------------------
 # Stat Aggregator & Award Engine
 # ---------------------------
+# Column layout for StatAggregator rows (order matches the returned dicts)
+AGG_STAT_KEYS = ("games_played","pass_completions","pass_attempts","pass_yards","pass_tds",
+                 "rush_attempts","rush_yards","rush_tds","broken_tackles","targets","yac")
+(_GP, _PASS_CMP, _PASS_ATT, _PASS_YDS, _PASS_TDS,
+ _RUSH_ATT, _RUSH_YDS, _RUSH_TDS, _BROKEN, _TARGETS, _YAC) = range(len(AGG_STAT_KEYS))
+
 class StatAggregator:
-    def __init__(self, events:List[Dict[str,Any]]):
+    def __init__(self, events:EventLog):
         self.events = events
 
     def aggregate(self)->Dict[str,Dict[str,float]]:
         """
-        Produce basic aggregated stats per player id.
+        Produce basic aggregated stats per player id from the log's columns.
         Returns {player_id: {stat: value}}
         """
-        agg:Dict[str,Dict[str,float]] = {}
-        for ev in self.events:
-            res = ev.get("result",{})
-            pid = ev.get("primary_player_id")
+        log = self.events
+        # accumulate into flat per-player rows; dicts are only built once at the end
+        rows:Dict[str,List[float]] = {}
+        width = len(AGG_STAT_KEYS)
+        for pid, play_type, complete, yards, td, yac, broken in zip(
+                log.primary_player_id, log.play_type, log.complete, log.yards, log.td, log.yac, log.broken_tackles):
             if pid is None:
                 continue
-            if pid not in agg:
-                agg[pid] = {"games_played":0,"pass_completions":0,"pass_attempts":0,"pass_yards":0,"pass_tds":0,
-                            "rush_attempts":0,"rush_yards":0,"rush_tds":0,"broken_tackles":0,"targets":0,"yac":0}
+            row = rows.get(pid)
+            if row is None:
+                row = rows[pid] = [0]*width
             # simple heuristics
-            if ev.get("play_type")=="pass":
-                agg[pid]["pass_attempts"] += 1
-                if res.get("complete"):
-                    agg[pid]["pass_completions"] += 1
-                    agg[pid]["pass_yards"] += res.get("yards",0)
-                    agg[pid]["pass_tds"] += 1 if res.get("td") else 0
-                    agg[pid]["yac"] += res.get("yac",0)
-                else:
-                    # possible interception
-                    if res.get("interception"):
-                        pass
-                agg[pid]["targets"] += 1
-            elif ev.get("play_type")=="run":
-                agg[pid]["rush_attempts"] += 1
-                agg[pid]["rush_yards"] += res.get("yards",0)
-                agg[pid]["rush_tds"] += 1 if res.get("td") else 0
-                agg[pid]["broken_tackles"] += res.get("broken_tackles",0)
+            if play_type==PLAY_PASS:
+                row[_PASS_ATT] += 1
+                if complete:
+                    row[_PASS_CMP] += 1
+                    row[_PASS_YDS] += yards
+                    row[_PASS_TDS] += td
+                    row[_YAC] += yac
+                row[_TARGETS] += 1
+            elif play_type==PLAY_RUN:
+                row[_RUSH_ATT] += 1
+                row[_RUSH_YDS] += yards
+                row[_RUSH_TDS] += td
+                row[_BROKEN] += broken
             # games_played is rough; one event -> a snap -> counts as presence
-            agg[pid]["games_played"] = agg[pid].get("games_played",0) + 0.01
-        # normalize games_played to more reasonable value by dividing by average snaps per simulated game
-        for pid,stats in agg.items():
-            stats["games_played"] = round(stats["games_played"] / 6.0, 2)  # approx scaling
+            row[_GP] += 0.01
+        agg:Dict[str,Dict[str,float]] = {}
+        for pid,row in rows.items():
+            # normalize games_played to more reasonable value by dividing by average snaps per simulated game
+            row[_GP] = round(row[_GP] / 6.0, 2)  # approx scaling
+            agg[pid] = dict(zip(AGG_STAT_KEYS, row))
         return agg
 
+# (stat, weight) terms of the MVP impact score, summed in this order
+MVP_IMPACT_WEIGHTS = (("rush_yards",0.7),("pass_yards",1.1),("rush_tds",20),("pass_tds",25),("yac",0.3))
+
 class AwardEngine:
     def __init__(self, player_lookup:Dict[str,Player], agg_stats:Dict[str,Dict[str,float]]):
         self.player_lookup = player_lookup
@@ -762,17 +1137,15 @@ class AwardEngine:
             p = self.player_lookup.get(pid)
             if p is None:
                 continue
-            impact = stats.get("rush_yards",0)*0.7 + stats.get("pass_yards",0)*1.1 + stats.get("rush_tds",0)*20 + stats.get("pass_tds",0)*25 + stats.get("yac",0)*0.3
+            impact = sum(stats.get(k,0)*w for k,w in MVP_IMPACT_WEIGHTS)
             # narrative boost from morale / injuries
-            narrative_boost = (p.morale - 0.5)*10 - (len(p.injuries)*5)
-            score = impact + narrative_boost
-            candidates.append({"player":p, "stats":stats, "impact":impact, "score":score})
-        candidates.sort(key=lambda x: x["score"], reverse=True)
+            narrative_boost = (p.morale - 0.5)*10 - (p.injury_count*5)
+            candidates.append((impact + narrative_boost, impact, p, stats))
+        # partial selection: only the top_n survivors are ranked and given justifications
+        top = heapq.nlargest(top_n, candidates, key=lambda c: c[0])
         # create justification
         results = []
-        for c in candidates[:top_n]:
-            p=c["player"]
-            s=c["stats"]
+        for score, impact, p, s in top:
             reasons=[]
             if s.get("pass_yards",0)>200:
                 reasons.append(f"{s.get('pass_yards',0)} passing yards")
@@ -780,75 +1153,69 @@ class AwardEngine:
                 reasons.append(f"{s.get('rush_yards',0)} rushing yards")
             if s.get("pass_tds",0)+s.get("rush_tds",0)>2:
                 reasons.append(f"{s.get('pass_tds',0)+s.get('rush_tds',0)} total TDs")
-            if len(p.injuries)>0:
-                reasons.append(f"played through {len(p.injuries)} injury events")
+            if p.injury_count>0:
+                reasons.append(f"played through {p.injury_count} injury events")
             justification = "; ".join(reasons) if reasons else "consistently high impact plays"
-            results.append({"player_id":p.id,"player_name":p.name,"score":round(c["score"],2),"impact":round(c["impact"],2),"justification":justification})
+            results.append({"player_id":p.id,"player_name":p.name,"score":round(score,2),"impact":round(impact,2),"justification":justification})
         return results
 
 # ---------------------------
 # Example: Build small league, simulate season
 # ---------------------------
+# Sample roster template: (positions, count, base age, age spread, ((attr, lo, hi), ...)).
+# Slots with several positions draw one per player; single-player slots are unnumbered.
+_SAMPLE_ROSTER = (
+    (("QB",), 1, 24, 0, (("awareness",55,85),("throw_power",60,95),("speed",40,70))),
+    (("RB",), 2, 20, 6, (("speed",60,95),("break_tackle",45,85),("awareness",40,70))),
+    (("WR",), 3, 19, 8, (("speed",60,99),("route_running",50,90),("catching",45,90))),
+    (("OL",), 5, 25, 6, (("strength",50,90),("awareness",40,70))),  # OL placeholder
+    (("DL","LB","DB"), 6, 22, 6, (("strength",50,95),("awareness",40,80))),
+)
+
 def build_sample_team(team_name:str, city:str, seed_offset:int=0)->Team:
     rng = seeded_rand(seed_offset)
+    randint = rng.randint
     roster=[]
-    # create QB
-    qb = Player(id=str(uuid.uuid4()), name=f"{team_name} QB", position="QB", age=24,
-                attributes={"awareness":rng.randint(55,85),"throw_power":rng.randint(60,95),"speed":rng.randint(40,70)}, hidden_potential=rng.random())
-    roster.append(qb)
-    # RBs
-    for i in range(2):
-        r = Player(id=str(uuid.uuid4()), name=f"{team_name} RB{i+1}", position="RB", age=20+rng.randint(0,6),
-                   attributes={"speed":rng.randint(60,95),"break_tackle":rng.randint(45,85),"awareness":rng.randint(40,70)}, hidden_potential=rng.random())
-        roster.append(r)
-    # WRs
-    for i in range(3):
-        w = Player(id=str(uuid.uuid4()), name=f"{team_name} WR{i+1}", position="WR", age=19+rng.randint(0,8),
-                   attributes={"speed":rng.randint(60,99),"route_running":rng.randint(50,90),"catching":rng.randint(45,90)}, hidden_potential=rng.random())
-        roster.append(w)
-    # OL placeholder
-    for i in range(5):
-        o = Player(id=str(uuid.uuid4()), name=f"{team_name} OL{i+1}", position="OL", age=25+rng.randint(0,6),
-                   attributes={"strength":rng.randint(50,90),"awareness":rng.randint(40,70)}, hidden_potential=rng.random())
-        roster.append(o)
-    # DL/LB/DB
-    for i in range(6):
-        pos = rng.choice(["DL","LB","DB"])
-        d = Player(id=str(uuid.uuid4()), name=f"{team_name} {pos}{i+1}", position=pos, age=22+rng.randint(0,6),
-                   attributes={"strength":rng.randint(50,95),"awareness":rng.randint(40,80)}, hidden_potential=rng.random())
-        roster.append(d)
+    for positions, count, base_age, age_spread, attr_ranges in _SAMPLE_ROSTER:
+        for i in range(count):
+            pos = positions[0] if len(positions)==1 else rng.choice(positions)
+            name = f"{team_name} {pos}" if count==1 else f"{team_name} {pos}{i+1}"
+            age = base_age + randint(0,age_spread) if age_spread else base_age
+            attrs = {attr:randint(lo,hi) for attr,lo,hi in attr_ranges}
+            roster.append(Player(id=str(uuid.uuid4()), name=name, position=pos, age=age,
+                                 attributes=attrs, hidden_potential=rng.random()))
     team = Team(id=str(uuid.uuid4()), name=team_name, city=city, roster=roster,
                 scheme_bias={"run":0.45,"pass":0.55} if rng.random()>0.5 else {"run":0.6,"pass":0.4},
                 coach_quality=0.45 + rng.random()*0.4,
                 resources=0.8 + rng.random()*0.6)
     return team
 
-def simulate_league(season_len:int=8):
+def simulate_league(season_len:int=8, workers:Optional[int]=None, record_injury_detail:bool=False):
     rng = seeded_rand(0)
-    gs = GameSimulator(rng)
-    franchises = build_nfl_franchises()
+    franchises = _NFL_FRANCHISES
     teams = [build_sample_team(f.name, f.city, seed_offset=i+1) for i,f in enumerate(franchises)]
 
-    all_game_events=[]
+    all_game_events=EventLog()
     games=[]
     # divisions of 4 teams each
     divisions = [teams[i:i+4] for i in range(0, len(teams), 4)]
-    week = 1
+    # schedule every game with its own sub-seed up front; games are independent, so they
+    # can be played on `workers` processes and merged back in schedule order
+    pairings = []
     for div in divisions:
         idxs = list(range(len(div)))
         for h in idxs:
             for a in idxs:
                 if h == a:
                     continue
-                home = div[h]
-                away = div[a]
-                gr = gs.simulate_game(home, away)
-                gr["week"] = week
-                gr["division_game"] = True
-                games.append(gr)
-                all_game_events.extend(gs.log.dump())
-                gs.log = EventLog()
-                week += 1
+                pairings.append((div[h], div[a]))
+    matchups = [(home, away, seed) for (home, away), seed in zip(pairings, spawn_seeds(rng, len(pairings)))]
+    for week, ((home, away, _), (gr, events)) in enumerate(zip(matchups, play_games(matchups, workers)), start=1):
+        apply_game_result(gr, home, away, record_injury_detail)
+        gr["week"] = week
+        gr["division_game"] = True
+        games.append(gr)
+        all_game_events.extend(events)
 
     # aggregate stats
     aggregator = StatAggregator(all_game_events)
@@ -864,7 +1231,7 @@ def simulate_league(season_len:int=8):
     for div_idx, div in enumerate(divisions):
         print(f"Division {div_idx+1}:")
         for t in div:
-            print(f"  {t.city} {t.name} - W:{t.season_stats['wins']} L:{t.season_stats['losses']} PF:{t.season_stats['points_for']} PA:{t.season_stats['points_against']} Coach:{t.coach_quality:.2f}")
+            print(f"  {t.city} {t.name} - W:{t.stats.wins} L:{t.stats.losses} PF:{t.stats.points_for} PA:{t.stats.points_against} Coach:{t.coach_quality:.2f}")
 
     print("\nTop Candidates (MVP):")
     for m in mvps:
@@ -872,13 +1239,13 @@ def simulate_league(season_len:int=8):
     print("\nTotal plays logged:", len(all_game_events))
     return {"teams":teams, "games":games, "events":all_game_events, "agg":agg, "mvps":mvps}
 
-def run_career_demo()->CareerState:
+def run_career(eng:CareerEngine, first:str, last:str, pos:str="QB", stars:int=3, nfl_seasons:int=3)->CareerState:
     """
-    Quick HS -> College -> NFL path to show the CareerEngine loop.
+    One full HS -> College -> NFL path: four HS years, commit to the most prestigious
+    offer, up to four college years (early declarations skip the rest), then the draft
+    and nfl_seasons NFL years stored on state.nfl_stats.
     """
-    rng = seeded_rand(101)
-    eng = CareerEngine(rng)
-    state = eng.create_prospect("Alex", "Game", pos="QB", stars=2)
+    state = eng.create_prospect(first, last, pos=pos, stars=stars)
     for y in range(4):
         eng.simulate_high_school_year(state, year=y+1)
     eng.generate_college_offers(state)
@@ -892,8 +1259,34 @@ def run_career_demo()->CareerState:
             break
     if state.stage != "NFL":
         eng.promote_to_nfl(state)
+    state.nfl_stats = eng.simulate_nfl_seasons(state, seasons=nfl_seasons)
+    return state
+
+def _career_task(job:tuple)->CareerState:
+    # process-pool entry point: (first, last, pos, stars, nfl_seasons, seed) -> finished career
+    first, last, pos, stars, nfl_seasons, seed = job
+    return run_career(CareerEngine(random.Random(seed), verbose=False), first, last, pos, stars, nfl_seasons)
+
+def simulate_batch(prospects:List[tuple], nfl_seasons:int=3, workers:Optional[int]=None,
+                   seed_offset:int=500)->List[CareerState]:
+    """
+    Monte Carlo careers for (first, last, pos, stars) prospects, returned in input order.
+    Each career runs on its own child seed from spawn_seeds(seeded_rand(seed_offset)),
+    so results are identical inline or across a process pool of `workers`. History
+    beats are not recorded (CareerEngine verbose=False).
+    """
+    seeds = spawn_seeds(seeded_rand(seed_offset), len(prospects))
+    jobs = [(first, last, pos, stars, nfl_seasons, seed) for (first, last, pos, stars), seed in zip(prospects, seeds)]
+    return _pool_map(_career_task, jobs, workers)
+
+def run_career_demo()->CareerState:
+    """
+    Quick HS -> College -> NFL path to show the CareerEngine loop.
+    """
+    rng = seeded_rand(101)
+    eng = CareerEngine(rng)
     # simulate some NFL seasons for the career summary
-    state.nfl_stats = eng.simulate_nfl_seasons(state, seasons=20)
+    state = run_career(eng, "Alex", "Game", pos="QB", stars=2, nfl_seasons=20)
 
     print("\n=== Career Demo ===")
     print(f"{state.player.name} ({state.player.position}) final stars: {state.star_rating:.2f}")
@@ -910,48 +1303,50 @@ def run_career_demo()->CareerState:
     print(f"Career totals: HS {total_hs_yds} yds · College {total_cfb_yds} yds · NFL {total_nfl_pass} pass yds · Awards {len(state.awards)}")
     return state
 
-def simulate_nfl_season_with_playoffs(num_weeks:int=17):
+def simulate_nfl_season_with_playoffs(num_weeks:int=17, workers:Optional[int]=None,
+                                      record_injury_detail:bool=False):
     """
     Build all NFL teams, simulate a 17-week season (random pairings each week),
     compute standings, then run a simple 8-team playoff bracket to a Super Bowl champion.
+    Every game runs on its own sub-seed, so the regular season (and each playoff round)
+    can be played across `workers` processes with identical results. record_injury_detail
+    keeps timestamped Player.injuries/career_events records (injury_count is always kept).
     """
     rng = seeded_rand(202)
-    gs = GameSimulator(rng)
-    franchises = build_nfl_franchises()
+    franchises = _NFL_FRANCHISES
     teams = [build_sample_team(fr.name, fr.city, seed_offset=300+idx) for idx,fr in enumerate(franchises)]
     games=[]
-    all_events=[]
+    all_events=EventLog()
 
-    # Regular season schedule: weekly shuffle/pair
+    # Regular season schedule: weekly shuffle/pair. Pairings never depend on results, so the
+    # whole schedule (with one sub-seed per game) is drawn up front and played in one batch.
+    matchups = []
+    weeks = []
     for week in range(1, num_weeks+1):
         rng.shuffle(teams)
-        for i in range(0, len(teams), 2):
-            if i+1 >= len(teams):
-                continue
-            home = teams[i]
-            away = teams[i+1]
-            gr = gs.simulate_game(home, away)
-            gr["week"] = week
-            games.append(gr)
-        all_events.extend(gs.log.dump())
-        gs.log = EventLog()
-
-    # standings already in season_stats
-    standings = sorted(teams, key=lambda t: (t.season_stats["wins"], t.season_stats["points_for"]-t.season_stats["points_against"]), reverse=True)
-
-    # Playoffs: top 8 overall seeds single-elimination
+        pairs = [(teams[i], teams[i+1]) for i in range(0, len(teams)-1, 2)]
+        matchups.extend((home, away, seed) for (home, away), seed in zip(pairs, spawn_seeds(rng, len(pairs))))
+        weeks.extend([week]*len(pairs))
+    for week, (home, away, _), (gr, events) in zip(weeks, matchups, play_games(matchups, workers)):
+        apply_game_result(gr, home, away, record_injury_detail)
+        gr["week"] = week
+        games.append(gr)
+        all_events.extend(events)
+
+    # standings come straight from each team's TeamStats
+    standings = sorted(teams, key=lambda t: (t.stats.wins, t.stats.points_for-t.stats.points_against), reverse=True)
+
+    # Playoffs: top 8 overall seeds single-elimination; each round's games are independent
     seeds = standings[:8]
     bracket = []
     current_round = seeds
     round_num = 1
     while len(current_round) > 1:
+        pairs = [(current_round[i], current_round[i+1]) for i in range(0, len(current_round)-1, 2)]
+        round_matchups = [(home, away, seed) for (home, away), seed in zip(pairs, spawn_seeds(rng, len(pairs)))]
         next_round = []
-        for i in range(0, len(current_round), 2):
-            if i+1 >= len(current_round):
-                continue
-            home = current_round[i]
-            away = current_round[i+1]
-            gr = gs.simulate_game(home, away)
+        for (home, away, _), (gr, events) in zip(round_matchups, play_games(round_matchups, workers)):
+            apply_game_result(gr, home, away, record_injury_detail)
             gr["round"] = round_num
             bracket.append({
                 "round": round_num,
@@ -962,8 +1357,7 @@ def simulate_nfl_season_with_playoffs(num_weeks:int=17):
             })
             winner = home if gr["score"]["home"] >= gr["score"]["away"] else away
             next_round.append(winner)
-            all_events.extend(gs.log.dump())
-            gs.log = EventLog()
+            all_events.extend(events)
         current_round = next_round
         round_num += 1
     champion = current_round[0].name if current_round else None
@@ -998,7 +1392,7 @@ if __name__ == "__main__":
     print(f"Champion: {nfl_full['champion']}")
     print("Top 5 Standings:")
     for t in nfl_full["standings"][:5]:
-        print(f" - {t.city} {t.name}: {t.season_stats['wins']}-{t.season_stats['losses']} PF:{t.season_stats['points_for']} PA:{t.season_stats['points_against']}")
+        print(f" - {t.city} {t.name}: {t.stats.wins}-{t.stats.losses} PF:{t.stats.points_for} PA:{t.stats.points_against}")
     print("Playoffs (round by round):")
     for game in nfl_full["playoffs"]:
         print(f"  Round {game['round']}: {game['home']} {game['score']['home']} vs {game['away']} {game['score']['away']} -> {game['winner']}")
@@ -1015,38 +1409,12 @@ if __name__ == "__main__":
     total_nfl_ints = sum(s.get("ints",0) for s in getattr(career_state, "nfl_stats", []))
     awards_count = len(career_state.awards)
     awards_by_level = {"HS": [], "College": [], "NFL": []}
-    awards_breakdown = {
-        "super_bowl": 0,
-        "mvp": 0,
-        "pro_bowl": 0,
-        "all_pro": 0,
-        "heisman": 0,
-        "all_american": 0,
-        "maxwell": 0
-    }
+    awards_breakdown = dict.fromkeys(AWARD_BREAKDOWN_KEYS.values(), 0)
     for a in career_state.awards:
-        lvl = a.get("level","").title()
-        if lvl.upper() == "HS":
-            awards_by_level["HS"].append(a)
-        elif lvl.upper() == "COLLEGE":
-            awards_by_level["College"].append(a)
-        else:
-            awards_by_level["NFL"].append(a)
-        name = a.get("name","").lower()
-        if "super bowl" in name:
-            awards_breakdown["super_bowl"] += 1
-        if "mvp" in name:
-            awards_breakdown["mvp"] += 1
-        if "pro bowl" in name:
-            awards_breakdown["pro_bowl"] += 1
-        if "all-pro" in name or "all pro" in name:
-            awards_breakdown["all_pro"] += 1
-        if "heisman" in name:
-            awards_breakdown["heisman"] += 1
-        if "all-american" in name:
-            awards_breakdown["all_american"] += 1
-        if "maxwell" in name:
-            awards_breakdown["maxwell"] += 1
+        awards_by_level[AWARD_LEVEL_KEYS.get(a.get("level","").upper(), "NFL")].append(a)
+        key = AWARD_BREAKDOWN_KEYS.get(a.get("name",""))
+        if key is not None:
+            awards_breakdown[key] += 1
     # append breakdown to history for visibility and print
     breakdown_line = (
         f"Awards summary — SB:{awards_breakdown['super_bowl']} MVP:{awards_breakdown['mvp']} "
@@ -1057,47 +1425,46 @@ if __name__ == "__main__":
     print(" - " + breakdown_line)
 
     # optionally save outputs for further inspection
-    with open("sim_output.json","w") as f:
-        json.dump({
-            "mvps": out["mvps"],
-            "teams": [{ "id":t.id, "name":t.name, "city":t.city, "season_stats": t.season_stats} for t in out["teams"]],
-            "event_count": len(out["events"]),
-            "career_summary": {
-                "player": career_state.player.name,
-                "position": career_state.player.position,
-                "stars": career_state.star_rating,
-                "college": career_state.college_team.name if career_state.college_team else None,
-                "draft_projection": career_state.draft_projection,
-                "nfl_team": career_state.nfl_team,
-                "hs_stats": career_state.hs_stats,
-                "college_stats": getattr(career_state, "college_stats", []),
-                "offers": career_state.college_offers,
-                "nfl_stats": getattr(career_state, "nfl_stats", []),
-                "awards": awards_by_level,
-                "retired": career_state.retired,
-                "retired_year": career_state.retired_year,
-                "totals": {
-                    "hs_yards": total_hs_yds,
-                    "hs_tds": total_hs_tds,
-                    "college_yards": total_cfb_yds,
-                    "college_tds": total_cfb_tds,
-                    "nfl_pass_yards": total_nfl_pass,
-                    "nfl_pass_tds": total_nfl_tds,
-                    "nfl_ints": total_nfl_ints,
-                    "awards_count": awards_count,
-                    "awards_breakdown": awards_breakdown
-                },
-                "history": career_state.history
+    write_json("sim_output.json", {
+        "mvps": out["mvps"],
+        "teams": [{ "id":t.id, "name":t.name, "city":t.city, "season_stats": t.season_stats} for t in out["teams"]],
+        "event_count": len(out["events"]),
+        "career_summary": {
+            "player": career_state.player.name,
+            "position": career_state.player.position,
+            "stars": career_state.star_rating,
+            "college": career_state.college_team.name if career_state.college_team else None,
+            "draft_projection": career_state.draft_projection,
+            "nfl_team": career_state.nfl_team,
+            "hs_stats": career_state.hs_stats,
+            "college_stats": getattr(career_state, "college_stats", []),
+            "offers": career_state.college_offers,
+            "nfl_stats": getattr(career_state, "nfl_stats", []),
+            "awards": awards_by_level,
+            "retired": career_state.retired,
+            "retired_year": career_state.retired_year,
+            "totals": {
+                "hs_yards": total_hs_yds,
+                "hs_tds": total_hs_tds,
+                "college_yards": total_cfb_yds,
+                "college_tds": total_cfb_tds,
+                "nfl_pass_yards": total_nfl_pass,
+                "nfl_pass_tds": total_nfl_tds,
+                "nfl_ints": total_nfl_ints,
+                "awards_count": awards_count,
+                "awards_breakdown": awards_breakdown
             },
-            "nfl_season": {
-                "champion": nfl_full["champion"],
-                "mvps": nfl_full["mvps"],
-                "playoffs": nfl_full["playoffs"],
-                "standings": [
-                    {"team": t.name, "city": t.city, "wins": t.season_stats["wins"], "losses": t.season_stats["losses"], "pf": t.season_stats["points_for"], "pa": t.season_stats["points_against"]}
-                    for t in nfl_full["standings"]
-                ],
-                "games": [{"week": g.get("week","?"), "home": g["home_name"], "away": g["away_name"], "score": g["score"]} for g in nfl_full["games"]]
-            }
-        }, f, indent=2)
+            "history": career_state.history
+        },
+        "nfl_season": {
+            "champion": nfl_full["champion"],
+            "mvps": nfl_full["mvps"],
+            "playoffs": nfl_full["playoffs"],
+            "standings": [
+                {"team": t.name, "city": t.city, "wins": t.stats.wins, "losses": t.stats.losses, "pf": t.stats.points_for, "pa": t.stats.points_against}
+                for t in nfl_full["standings"]
+            ],
+            "games": [{"week": g.get("week","?"), "home": g["home_name"], "away": g["away_name"], "score": g["score"]} for g in nfl_full["games"]]
+        }
+    })
     print("\nSim output written to sim_output.json")